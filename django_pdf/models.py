@@ -12,6 +12,8 @@ from reportlab.pdfgen import canvas
 from typeguard import check_type
 from xhtml2pdf import pisa
 
+from django_pdf.rendering import get_render_backend
+
 # ReportLab point unit
 PointUnit = NewType("PointUnit", float)
 
@@ -62,7 +64,11 @@ class BaseTemplate(models.Model):
             )
 
     def generate_pdf_document(self, context: Dict[str, Any]) -> BytesIO:
-        raise NotImplemented
+        self.validate_context(context)
+        return get_render_backend().render(self, context)
+
+    def render_pdf_document(self, context: Dict[str, Any]) -> BytesIO:
+        raise NotImplementedError
 
     class Meta:
         abstract = True
@@ -75,8 +81,7 @@ class HTMLTemplate(BaseTemplate):
         verbose_name="source html file",
     )
 
-    def generate_pdf_document(self, context: Dict[str, Any]) -> BytesIO:
-        self.validate_context(context)
+    def render_pdf_document(self, context: Dict[str, Any]) -> BytesIO:
         html = self.render_html(context=context)
         pdf_buffer = BytesIO()
         pisa.CreatePDF(html, dest=pdf_buffer)
@@ -111,8 +116,7 @@ class PDFTemplate(BaseTemplate):
         verbose_name="source pdf file",
     )
 
-    def generate_pdf_document(self, context: Dict[str, Any]) -> BytesIO:
-        self.validate_context(context)
+    def render_pdf_document(self, context: Dict[str, Any]) -> BytesIO:
         self.template_file.file.seek(0)
         pdf_reader = PdfReader(self.template_file.file)
         page_width, page_height = self._get_pdf_dimensions(pdf_reader)
@@ -0,0 +1,232 @@
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+from io import BytesIO
+from typing import Any, Dict, Optional
+
+import django
+from django.conf import settings
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_OPTIONS = {
+    "workers": 2,
+    "timeout": 30,
+    "max_memory_mb": None,
+    "max_tasks_per_worker": 100,
+    "start_method": None,
+}
+
+
+class RenderError(Exception):
+    code = "render_error"
+
+    def __init__(self, message: str, **details: Any) -> None:
+        super().__init__(message)
+        self.message = message
+        self.details = details
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"code": self.code, "message": self.message, **self.details}
+
+
+class RenderTimeoutError(RenderError):
+    code = "timeout"
+
+
+class RenderMemoryError(RenderError):
+    code = "memory_limit"
+
+
+class RenderWorkerError(RenderError):
+    code = "worker_crashed"
+
+
+class RenderFailedError(RenderError):
+    code = "render_failed"
+
+
+class RenderPoolBusyError(RenderError):
+    code = "pool_busy"
+
+
+class InlineRenderBackend:
+    """Renders in the calling process, the default."""
+
+    def render(self, template, context: Dict[str, Any]) -> BytesIO:
+        return template.render_pdf_document(context)
+
+
+class _Worker:
+    def __init__(self, mp_context, max_memory_mb: Optional[int]) -> None:
+        self.connection, child_connection = mp_context.Pipe()
+        self.process = mp_context.Process(
+            target=_worker_main,
+            args=(child_connection, max_memory_mb),
+            daemon=True,
+        )
+        self.process.start()
+        child_connection.close()
+        self.tasks_done = 0
+
+    def stop(self) -> None:
+        self.connection.close()
+        self.process.kill()
+        self.process.join()
+
+
+def _worker_main(connection, max_memory_mb: Optional[int]) -> None:
+    # Needed when the worker is spawned rather than forked
+    django.setup()
+    if max_memory_mb and resource:
+        limit = max_memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    while True:
+        try:
+            template, context = connection.recv()
+        except EOFError:
+            return
+        try:
+            pdf_buffer = template.render_pdf_document(context)
+        except MemoryError:
+            # The worker can't be trusted after this, let it be replaced
+            connection.send(("memory_limit", None))
+            return
+        except Exception as error:
+            connection.send(("render_failed", (type(error).__name__, str(error))))
+        else:
+            connection.send(("ok", pdf_buffer.getvalue()))
+
+
+class PoolRenderBackend:
+    """
+    Renders in a pool of pre-started worker processes.
+
+    Each render is given `timeout` seconds of wall-clock time and each worker
+    is limited to `max_memory_mb` of address space. Workers are replaced
+    after `max_tasks_per_worker` renders, or as soon as a budget is exceeded.
+    A render waits at most `timeout` seconds for a free worker.
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        timeout: float = 30,
+        max_memory_mb: Optional[int] = None,
+        max_tasks_per_worker: int = 100,
+        start_method: Optional[str] = None,
+    ) -> None:
+        self.timeout = timeout
+        self.max_memory_mb = max_memory_mb
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self._mp_context = multiprocessing.get_context(start_method)
+        self._idle_workers = queue.Queue()
+        for _ in range(workers):
+            self._idle_workers.put(self._start_worker())
+
+    def render(self, template, context: Dict[str, Any]) -> BytesIO:
+        worker = self._acquire_worker()
+        recycle = True
+        try:
+            status, payload = self._run(worker, template, context)
+            if status == "memory_limit":
+                raise RenderMemoryError(
+                    "The render exceeded the worker memory limit",
+                    max_memory_mb=self.max_memory_mb,
+                )
+            recycle = worker.tasks_done >= self.max_tasks_per_worker
+            if status == "render_failed":
+                error_type, error_message = payload
+                raise RenderFailedError(
+                    f"{error_type}: {error_message}", error_type=error_type
+                )
+            return BytesIO(payload)
+        finally:
+            if recycle:
+                worker.stop()
+                worker = self._try_start_worker()
+            self._idle_workers.put(worker)
+
+    def _acquire_worker(self) -> _Worker:
+        try:
+            worker = self._idle_workers.get(timeout=self.timeout)
+        except queue.Empty:
+            raise RenderPoolBusyError(
+                f"No render worker became free within {self.timeout} seconds",
+                timeout=self.timeout,
+            )
+        # Empty slots are left behind by workers that failed to start
+        if worker is None:
+            worker = self._try_start_worker()
+            if worker is None:
+                self._idle_workers.put(None)
+                raise RenderWorkerError(
+                    "The render worker could not be started"
+                )
+        return worker
+
+    def _run(self, worker: _Worker, template, context: Dict[str, Any]):
+        worker.tasks_done += 1
+        try:
+            worker.connection.send((template, context))
+            if not worker.connection.poll(self.timeout):
+                raise RenderTimeoutError(
+                    f"The render took longer than {self.timeout} seconds",
+                    timeout=self.timeout,
+                )
+            return worker.connection.recv()
+        except (EOFError, OSError):
+            worker.process.join(timeout=1)
+            raise RenderWorkerError(
+                "The render worker exited unexpectedly",
+                exitcode=worker.process.exitcode,
+            )
+
+    def _start_worker(self) -> _Worker:
+        return _Worker(self._mp_context, self.max_memory_mb)
+
+    def _try_start_worker(self) -> Optional[_Worker]:
+        try:
+            return self._start_worker()
+        except Exception:
+            logger.exception("Failed to start a render worker")
+            return None
+
+    def close(self) -> None:
+        while not self._idle_workers.empty():
+            if worker := self._idle_workers.get_nowait():
+                worker.stop()
+
+
+_backend = None
+_backend_pid = None
+_backend_lock = threading.Lock()
+
+
+def get_render_backend():
+    global _backend, _backend_pid
+    with _backend_lock:
+        # A pool inherited from a parent process (e.g. a preloading server)
+        # holds pipes to workers that aren't ours, start a fresh one
+        if _backend is None or _backend_pid != os.getpid():
+            _backend = _create_render_backend()
+            _backend_pid = os.getpid()
+        return _backend
+
+
+def _create_render_backend():
+    backend_name = getattr(settings, "PDF_RENDER_BACKEND", "inline")
+    if backend_name == "inline":
+        return InlineRenderBackend()
+    if backend_name == "pool":
+        options = DEFAULT_POOL_OPTIONS | getattr(settings, "PDF_RENDER_POOL", {})
+        return PoolRenderBackend(**options)
+    raise ValueError(f"Unknown PDF_RENDER_BACKEND: {backend_name}")
@@ -1,3 +1,111 @@
+import os
+import time
+from io import BytesIO
+from unittest import mock, skipIf
+
+from django.conf import settings
 from django.test import TestCase
 
-# Create your tests here.
+from django_pdf import rendering
+from django_pdf.rendering import (InlineRenderBackend, PoolRenderBackend,
+                                  RenderError)
+
+
+class StubTemplate:
+    def __init__(self, behaviour: str = "ok") -> None:
+        self.behaviour = behaviour
+
+    def render_pdf_document(self, context):
+        if self.behaviour == "sleep":
+            time.sleep(10)
+        elif self.behaviour == "raise":
+            raise KeyError("missing")
+        elif self.behaviour == "exit":
+            os._exit(3)
+        elif self.behaviour == "allocate":
+            bytearray(4 * 1024 * 1024 * 1024)
+        return BytesIO(f"pdf:{context['name']}".encode())
+
+
+class PoolRenderBackendTest(TestCase):
+    def setUp(self) -> None:
+        self.backend = PoolRenderBackend(
+            workers=1,
+            timeout=2,
+            max_memory_mb=1024,
+            max_tasks_per_worker=2,
+            start_method="fork",
+        )
+        self.addCleanup(self.backend.close)
+
+    def get_worker_pid(self) -> int:
+        return self.backend._idle_workers.queue[0].process.pid
+
+    def render(self, behaviour: str = "ok") -> BytesIO:
+        return self.backend.render(StubTemplate(behaviour), {"name": "test"})
+
+    def assert_render_error(self, behaviour: str, code: str) -> None:
+        worker_pid = self.get_worker_pid()
+        with self.assertRaises(RenderError) as error_context:
+            self.render(behaviour)
+        self.assertEqual(error_context.exception.as_dict()["code"], code)
+        self.assertNotEqual(self.get_worker_pid(), worker_pid)
+        # The replacement worker still renders
+        self.assertEqual(self.render().getvalue(), b"pdf:test")
+
+    def test_render(self):
+        self.assertEqual(self.render().getvalue(), b"pdf:test")
+
+    def test_worker_recycled_after_max_tasks(self):
+        worker_pid = self.get_worker_pid()
+        self.render()
+        self.assertEqual(self.get_worker_pid(), worker_pid)
+        self.render()
+        self.assertNotEqual(self.get_worker_pid(), worker_pid)
+
+    def test_render_failed(self):
+        worker_pid = self.get_worker_pid()
+        with self.assertRaises(RenderError) as error_context:
+            self.render("raise")
+        self.assertEqual(
+            error_context.exception.as_dict(),
+            {
+                "code": "render_failed",
+                "message": "KeyError: 'missing'",
+                "error_type": "KeyError",
+            },
+        )
+        # A failed render is counted towards the worker's task budget
+        self.assertEqual(self.get_worker_pid(), worker_pid)
+        self.render()
+        self.assertNotEqual(self.get_worker_pid(), worker_pid)
+
+    def test_timeout(self):
+        self.assert_render_error("sleep", "timeout")
+
+    def test_worker_crashed(self):
+        self.assert_render_error("exit", "worker_crashed")
+
+    @skipIf(rendering.resource is None, "Memory limits need resource")
+    def test_memory_limit(self):
+        self.assert_render_error("allocate", "memory_limit")
+
+    def test_worker_start_failure_is_retried(self):
+        with mock.patch.object(
+            self.backend, "_start_worker", side_effect=OSError
+        ), self.assertLogs("django_pdf.rendering", "ERROR"):
+            self.render()
+            self.render()  # The worker is due for recycling
+        self.assertIsNone(self.backend._idle_workers.queue[0])
+        self.assertEqual(self.render().getvalue(), b"pdf:test")
+        self.assertIsNotNone(self.backend._idle_workers.queue[0])
+
+
+class GetRenderBackendTest(TestCase):
+    @mock.patch.object(rendering, "_backend", None)
+    def test_inline_by_default(self):
+        with self.settings():
+            del settings.PDF_RENDER_BACKEND
+            self.assertIsInstance(
+                rendering.get_render_backend(), InlineRenderBackend
+            )
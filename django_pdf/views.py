@@ -14,7 +14,9 @@ from django.views import View
 from django.views.generic import TemplateView, UpdateView
 
 from django_pdf.forms import FontFamilyForm, TemplateType, TemplateTypeForm
-from django_pdf.models import BaseTemplate, HTMLTemplate, PDFTemplate
+from django_pdf.models import (SUPPORTED_FONTS, BaseTemplate, HTMLTemplate,
+                               PDFTemplate)
+from django_pdf.rendering import RenderError
 
 
 # Mixin for handling permission checks
@@ -33,15 +35,30 @@ class DashboardView(TemplatesPermissionMixin, TemplateView):
 
 # Base class for handling template views
 class BaseTemplateView(TemplatesPermissionMixin, UpdateView):
-    def generate_pdf_document(self, template: BaseTemplate) -> str:
-        pdf_buffer = template.generate_pdf_document(template.example_context)
+    render_error = None
+
+    def generate_pdf_document(self, template: BaseTemplate) -> None | str:
+        try:
+            pdf_buffer = template.generate_pdf_document(
+                template.example_context
+            )
+        except RenderError as error:
+            self.render_error = error.as_dict()
+            return None
         current_hour = datetime.now().hour
         file_name = f"{template.PDF_TEMPLATE_DIR}/temp/{template.name}_{current_hour}.pdf"
         default_storage.delete(file_name)
         default_storage.save(file_name, pdf_buffer)
         return default_storage.url(file_name)
 
+    def get_context_data(self, **kwargs: Any) -> dict:
+        return super().get_context_data(**kwargs) | {
+            "render_error": self.render_error
+        }
+
     def get_success_url(self):
+        if self.request.POST.get("preview"):
+            return f"{self.object.url}?preview=1"
         return self.object.url
 
     def get_object(self, queryset: QuerySet = None):
@@ -88,10 +105,14 @@ class PDFTemplateView(BaseTemplateView):
         preview_pdf_url = None
         if pdf_template := self.get_object():
             template_file_url = pdf_template.template_file.url
-            preview_pdf_url = self.generate_pdf_document(pdf_template)
+            # The editor previews the example context client-side, only
+            # render on the server when a final preview is asked for
+            if self.request.GET.get("preview"):
+                preview_pdf_url = self.generate_pdf_document(pdf_template)
 
         return super().get_context_data(**kwargs) | {
             "font_form": FontFamilyForm(),
+            "supported_fonts": SUPPORTED_FONTS,
             "template_file_url": template_file_url,
             "preview_pdf_url": preview_pdf_url,
         }